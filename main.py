@@ -14,7 +14,6 @@ Provides real-time transcription with professional threading architecture.
 import sys
 import os
 import threading
-import queue
 import time
 from typing import Optional
 
@@ -25,6 +24,71 @@ from audio_capture import AudioCapture
 from vosk_engine import VoskEngine
 from text_buffer import TextBuffer
 from gui import LarynxGUI
+from spsc_ring import SPSCRing
+from vad import EnergyVAD
+
+# ASR catch-up: when more than BACKLOG_CHUNKS chunks are waiting, merge them
+# into one AcceptWaveform call, stopping once MAX_COALESCED_BYTES (2 s) is reached
+BACKLOG_CHUNKS = 2
+MAX_COALESCED_BYTES = 32000
+
+# CPU slots for the worker threads (core 0 stays with the GUI main loop)
+AUDIO_CORE = 1
+ASR_CORE = 2
+
+
+class TextUpdate:
+    """
+    Pending GUI text change.
+
+    Instances are recycled through a small pool so partial results do not
+    allocate a fresh object per update.
+    """
+
+    __slots__ = ('clear', 'delta', 'partial', 'word_count')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reset to an empty update."""
+        self.clear = False
+        self.delta = ""
+        self.partial = ""
+        self.word_count = 0
+
+
+def _gil_enabled():
+    """Check whether the interpreter runs with the GIL (always True before 3.13)."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled() if is_gil_enabled else True
+
+
+def _tune_worker_thread(core_index: int, niceness: int = 0):
+    """
+    Pin the calling thread to one core and raise its priority (Linux only).
+
+    Core 0 is left to the GUI main loop; pinning is skipped when there are
+    not enough cores. Failures (non-Linux, missing CAP_SYS_NICE) are ignored.
+
+    Args:
+        core_index (int): Index into the CPUs this process may run on
+        niceness (int): Nice increment, negative raises priority (0 to skip)
+    """
+    try:
+        # On Linux both calls act on the calling thread only
+        cores = sorted(os.sched_getaffinity(0))
+        if len(cores) > core_index:
+            os.sched_setaffinity(0, {cores[core_index]})
+    except (AttributeError, OSError):
+        pass
+
+    if niceness:
+        try:
+            os.nice(niceness)
+        except (AttributeError, OSError):
+            pass
+
 
 class LarynxApp:
     """
@@ -43,13 +107,23 @@ class LarynxApp:
         self.gui_update_thread: Optional[threading.Thread] = None
 
         # Queues for thread communication
-        self.audio_queue = queue.Queue(maxsize=100)  # Audio chunks
-        self.text_queue = queue.Queue(maxsize=50)    # Text updates for GUI
-
-        # Control flags
-        self.running = False
-        self.recording = False
+        self.audio_queue = SPSCRing(128)  # Audio chunks (lock-free SPSC)
+        self.dropped_chunks = 0  # Chunks lost to a full audio_queue (relay thread only)
+
+        # Latest-wins mailbox for GUI text updates: a burst of partials
+        # collapses into one render, while final deltas are accumulated
+        self._latest_update: Optional[TextUpdate] = None
+        self._update_pool: list = []  # Recycled TextUpdate objects
+        self._latest_lock = threading.Lock()
+        self._latest_evt = threading.Event()
+
+        # Control flags (Events rather than bare bools so cross-thread reads
+        # stay well-defined on free-threaded builds without the GIL)
+        self.running_event = threading.Event()
+        self.recording_event = threading.Event()
         self.shutdown_event = threading.Event()
+        self._finalized = threading.Event()  # Final result flushed for this recording
+        self._finalize_lock = threading.Lock()
 
         # Modules
         self.audio_capture: Optional[AudioCapture] = None
@@ -57,22 +131,33 @@ class LarynxApp:
         self.text_buffer: Optional[TextBuffer] = None
         self.gui: Optional[LarynxGUI] = None
 
+        # Background Vosk model load, overlapped with GUI construction
+        self._vosk_load_thread: Optional[threading.Thread] = None
+        self._vosk_load_error: Optional[Exception] = None
+        self.vad = EnergyVAD()  # Silence gate ahead of Vosk
+
         # Initialize modules
         self._init_modules()
 
     def _init_modules(self):
         """Initialize all application modules."""
         try:
+            # Vosk Engine (the model load is slow and uses disjoint resources,
+            # so it runs in the background while the rest is set up)
+            print("Initializing Vosk ASR engine in background...")
+            model_path = "models/vosk-model-en-us-0.22"
+            self._vosk_load_thread = threading.Thread(
+                target=self._load_vosk_engine,
+                args=(model_path,),
+                daemon=True,
+                name="Vosk-Load"
+            )
+            self._vosk_load_thread.start()
+
             # Audio Capture
             print("Initializing audio capture...")
             self.audio_capture = AudioCapture()
 
-            # Vosk Engine
-            print("Initializing Vosk ASR engine...")
-            model_path = "models/vosk-model-en-us-0.22"
-            self.vosk_engine = VoskEngine(model_path)
-            self.vosk_engine.start()
-
             # Text Buffer
             print("Initializing text buffer...")
             self.text_buffer = TextBuffer()
@@ -86,17 +171,46 @@ class LarynxApp:
             self.gui.stop_btn.config(command=self.stop_recording)
             self.gui.clear_btn.config(command=self.clear_text)
 
+            # Start stays disabled until the model is ready
+            self.gui.start_btn.config(state='disabled')
+            self.gui.root.after(100, self._check_vosk_loaded)
+
             print("✅ All modules initialized successfully")
 
         except Exception as e:
             print(f"❌ Initialization failed: {e}")
             sys.exit(1)
 
+    def _load_vosk_engine(self, model_path: str):
+        """Vosk load thread: load the model and create the recognizer."""
+        try:
+            engine = VoskEngine(model_path)
+            engine.start()
+            self.vosk_engine = engine
+        except Exception as e:
+            self._vosk_load_error = e
+
+    def _check_vosk_loaded(self):
+        """Poll the Vosk load thread from the Tk main loop."""
+        if self._vosk_load_thread.is_alive():
+            self.gui.root.after(100, self._check_vosk_loaded)
+            return
+
+        if self._vosk_load_error:
+            print(f"❌ Initialization failed: {self._vosk_load_error}")
+            self.gui.root.destroy()
+            return
+
+        print("✅ Vosk model ready")
+        self.gui.start_btn.config(state='normal')
+
     def start(self):
         """Launch the application."""
         print("🚀 Starting Larynx application...")
+        if not _gil_enabled():
+            print("🧵 Free-threaded Python detected: worker threads run in parallel")
 
-        self.running = True
+        self.running_event.set()
 
         # Start GUI update thread
         self.gui_update_thread = threading.Thread(
@@ -114,20 +228,33 @@ class LarynxApp:
         finally:
             self.shutdown()
 
+        if self._vosk_load_error:
+            sys.exit(1)
+
     def start_recording(self):
         """Start audio recording and transcription."""
-        if self.recording:
+        if self.recording_event.is_set():
+            return
+
+        # The Start button is disabled until the model loads, but be safe
+        if self._vosk_load_thread and self._vosk_load_thread.is_alive():
+            self._vosk_load_thread.join()
+        if self.vosk_engine is None:
             return
 
         print("🎤 Starting recording...")
-        self.recording = True
+        self._finalized.clear()
+        self.dropped_chunks = 0
+        self.recording_event.set()
 
         # Clear any previous text
         self.text_buffer.clear()
-        self.text_buffer.add_partial_text("")  # Reset display
+        self.text_buffer.add_partial_text("")
 
-        # Clear queues
+        # Clear queues, then reset the display (updates are incremental)
         self._clear_queues()
+        self._send_text_update('clear')
+        self.vad.reset()
 
         # Restart Vosk engine if needed
         if not self.vosk_engine.is_recognizing():
@@ -155,26 +282,22 @@ class LarynxApp:
     def _clear_queues(self):
         """Clear all queues to prevent stale data."""
         # Clear audio queue
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.audio_queue.clear()
 
-        # Clear text queue
-        while not self.text_queue.empty():
-            try:
-                self.text_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Clear pending text update
+        with self._latest_lock:
+            if self._latest_update is not None:
+                self._update_pool.append(self._latest_update)
+            self._latest_update = None
+            self._latest_evt.clear()
 
     def stop_recording(self):
         """Stop audio recording and transcription."""
-        if not self.recording:
+        if not self.recording_event.is_set():
             return
 
         print("🛑 Stopping recording...")
-        self.recording = False
+        self.recording_event.clear()
 
         # Stop audio capture
         if self.audio_capture:
@@ -187,6 +310,9 @@ class LarynxApp:
         if self.asr_thread and self.asr_thread.is_alive():
             self.asr_thread.join(timeout=2.0)
 
+        if self.dropped_chunks:
+            print(f"⚠️  {self.dropped_chunks} audio chunks dropped (ASR thread too slow)")
+
         # Get any remaining final results
         self._finalize_transcription()
 
@@ -194,28 +320,29 @@ class LarynxApp:
         self.gui.stop_recording()
 
     def _audio_capture_worker(self):
-        """Audio capture thread: continuously capture and queue audio chunks."""
+        """
+        Audio relay thread: move captured chunks from AudioCapture to the ASR ring.
+
+        The stream is started before this thread is pinned. On Linux a new
+        thread inherits its creator's affinity and nice value, so starting
+        it afterwards would leave PortAudio's callback thread on this core
+        too. Only the relay itself is pinned.
+        """
         print("🎵 Audio capture thread started")
 
-        # Start audio recording
+        # Start audio recording (PortAudio creates its callback thread here)
         self.audio_capture.start_recording()
+        _tune_worker_thread(AUDIO_CORE, niceness=-10)
 
-        while self.recording and not self.shutdown_event.is_set():
+        while self.recording_event.is_set() and not self.shutdown_event.is_set():
             try:
                 # Get audio chunk with timeout
                 chunk = self.audio_capture.get_audio_chunk(timeout=0.1)
 
                 if chunk:
-                    # Put in queue for ASR processing
-                    try:
-                        self.audio_queue.put(chunk, timeout=0.1)
-                    except queue.Full:
-                        # Remove oldest if queue full
-                        try:
-                            self.audio_queue.get_nowait()
-                            self.audio_queue.put(chunk, timeout=0.1)
-                        except:
-                            pass  # Skip if can't manage
+                    # Publish for ASR processing (dropped and counted if ring is full)
+                    if not self.audio_queue.push(chunk):
+                        self.dropped_chunks += 1
 
             except Exception as e:
                 print(f"Audio capture error: {e}")
@@ -226,11 +353,28 @@ class LarynxApp:
     def _asr_worker(self):
         """ASR processing thread: process audio chunks and generate text."""
         print("🧠 ASR processing thread started")
+        _tune_worker_thread(ASR_CORE)
+        sent_version = -1  # Text buffer version of the last partial sent to the GUI
 
-        while self.recording and not self.shutdown_event.is_set():
+        while self.recording_event.is_set() and not self.shutdown_event.is_set():
             try:
-                # Get audio chunk from queue
+                # Get audio chunk from ring
                 chunk = self.audio_queue.get(timeout=0.1)
+                if chunk is None:
+                    continue
+
+                # Catch up on a backlog by merging waiting chunks (int16 mono
+                # concatenates cleanly) instead of decoding them one by one
+                if len(self.audio_queue) > BACKLOG_CHUNKS:
+                    merged = bytearray(chunk)
+                    while (len(self.audio_queue) > BACKLOG_CHUNKS
+                           and len(merged) < MAX_COALESCED_BYTES):
+                        merged += self.audio_queue.pop()
+                    chunk = bytes(merged)
+
+                # Skip long silences instead of decoding them
+                if self.vad.should_skip(chunk):
+                    continue
 
                 # Process with Vosk
                 results = self.vosk_engine.process_audio(chunk)
@@ -238,17 +382,18 @@ class LarynxApp:
                 # Handle partial results
                 if results['partial']:
                     self.text_buffer.add_partial_text(results['partial'])
-                    # Send update to GUI
-                    self._send_text_update('partial', self.text_buffer.get_full_text())
+                    # Send update to GUI, unless cleaning left the text unchanged
+                    version = self.text_buffer.get_version()
+                    if version != sent_version:
+                        sent_version = version
+                        self._send_text_update('partial', partial=self.text_buffer.get_formatted_partial())
 
                 # Handle final results
                 if results['final']:
                     self.text_buffer.add_final_text(results['final'])
-                    # Send update to GUI
-                    self._send_text_update('final', self.text_buffer.get_full_text())
+                    # Send only the newly confirmed text to GUI
+                    self._send_text_update('final', delta=self.text_buffer.pop_new_finals())
 
-            except queue.Empty:
-                continue
             except Exception as e:
                 print(f"ASR processing error: {e}")
                 time.sleep(0.01)
@@ -259,30 +404,53 @@ class LarynxApp:
         print("🧠 ASR processing thread stopped")
 
     def _finalize_transcription(self):
-        """Finalize any remaining transcription results."""
+        """Finalize any remaining transcription results (once per recording)."""
+        # Called from both stop_recording and the ASR thread; only the
+        # first caller fetches Vosk's final result
+        with self._finalize_lock:
+            if self._finalized.is_set():
+                return
+            self._finalized.set()
+
         try:
             # Get any remaining final result from Vosk
             final_result = self.vosk_engine.get_final_result()
             if final_result:
                 self.text_buffer.add_final_text(final_result)
-                self._send_text_update('final', self.text_buffer.get_full_text())
+                self._send_text_update('final', delta=self.text_buffer.pop_new_finals())
 
             # Don't reset Vosk here - let it be reset on next start if needed
 
         except Exception as e:
             print(f"Finalization error: {e}")
 
-    def _send_text_update(self, update_type: str, text: str):
-        """Send text update to GUI queue."""
-        try:
-            update = {
-                'type': update_type,
-                'text': text,
-                'word_count': self.text_buffer.get_word_count()
-            }
-            self.text_queue.put(update, timeout=0.1)
-        except queue.Full:
-            pass  # Skip if GUI queue full
+    def _send_text_update(self, update_type: str, delta: str = "", partial: str = ""):
+        """
+        Merge an incremental text update into the GUI mailbox.
+
+        Args:
+            update_type (str): 'partial', 'final' or 'clear'
+            delta (str): Newly confirmed final text to append
+            partial (str): Current partial text, replaces the previous one
+        """
+        word_count = self.text_buffer.get_word_count()
+
+        with self._latest_lock:
+            update = self._latest_update
+            if update is None:
+                update = self._update_pool.pop() if self._update_pool else TextUpdate()
+                update.reset()
+                self._latest_update = update
+            if update_type == 'clear':
+                # A clear supersedes anything still pending
+                update.reset()
+                update.clear = True
+
+            # Finals accumulate so coalescing never loses text; partials overwrite
+            update.delta += delta
+            update.partial = partial
+            update.word_count = word_count
+            self._latest_evt.set()
 
     def _gui_update_worker(self):
         """GUI update thread: process text updates and update display."""
@@ -290,18 +458,30 @@ class LarynxApp:
 
         while not self.shutdown_event.is_set():
             try:
-                # Get text update from queue
-                update = self.text_queue.get(timeout=0.1)
+                # Sleep until a text update (or shutdown) sets the event,
+                # then take the latest one; no idle polling wake-ups
+                self._latest_evt.wait()
+                with self._latest_lock:
+                    update = self._latest_update
+                    self._latest_update = None
+                    self._latest_evt.clear()
+                if update is None:
+                    continue
 
                 # Update GUI
                 if self.gui:
-                    self.gui.update_text_display(update['text'])
+                    if update.clear:
+                        self.gui.update_text_display("")
+                    if update.delta:
+                        self.gui.append_final(update.delta)
+                    self.gui.set_partial(update.partial)
                     # Update word count in status
-                    self.gui.word_count = update['word_count']
-                    self.gui._update_status_text()
+                    self.gui.set_word_count(update.word_count)
+
+                # Hand the object back for reuse
+                with self._latest_lock:
+                    self._update_pool.append(update)
 
-            except queue.Empty:
-                continue
             except Exception as e:
                 print(f"GUI update error: {e}")
                 time.sleep(0.01)
@@ -312,18 +492,19 @@ class LarynxApp:
         """Clear all transcribed text."""
         if self.text_buffer:
             self.text_buffer.clear()
-            self._send_text_update('clear', "")
+            self._send_text_update('clear')
 
     def shutdown(self):
         """Gracefully shutdown the application."""
         print("🔄 Shutting down Larynx...")
 
-        self.running = False
-        self.recording = False
+        self.running_event.clear()
+        self.recording_event.clear()
         self.shutdown_event.set()
+        self._latest_evt.set()  # Wake the GUI update thread so it can exit
 
         # Stop recording if active
-        if self.recording:
+        if self.recording_event.is_set():
             self.stop_recording()
 
         # Wait for threads
@@ -5,8 +5,52 @@ Setup script to download the Vosk model for Larynx ASR tool.
 
 import urllib.request
 import zipfile
+import hashlib
+import shutil
+import mmap
 import os
 
+# Copy buffer for download and extraction (1 MiB instead of the 8-64 KiB defaults)
+COPY_BUFSIZE = 1 << 20
+
+# Expected SHA-256 of the model zip. Leave None to only print the digest;
+# set it (or LARYNX_MODEL_SHA256) to the published value to enforce a match.
+MODEL_SHA256 = os.environ.get("LARYNX_MODEL_SHA256")
+
+def _download(url, dest_path):
+    """Stream a URL to disk in large chunks."""
+    with urllib.request.urlopen(url) as response, open(dest_path, 'wb') as out:
+        shutil.copyfileobj(response, out, length=COPY_BUFSIZE)
+
+def _extract(zip_path, dest_dir):
+    """Extract a zip member by member, streaming each with a large buffer."""
+    root = os.path.realpath(dest_dir)
+
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for info in zip_ref.infolist():
+            target = os.path.realpath(os.path.join(dest_dir, info.filename))
+            if os.path.commonpath([root, target]) != root:
+                raise ValueError(f"Unsafe path in archive: {info.filename}")
+
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=COPY_BUFSIZE)
+
+def _sha256_file(path):
+    """Hash a file without reading it into memory."""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+        # Older Pythons: hash a read-only mapping so OpenSSL sees one
+        # contiguous buffer without a userspace copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
 def download_vosk_model():
     url = "https://alphacephei.com/vosk/models/vosk-model-en-us-0.22.zip"
     zip_path = os.path.join("models", "vosk-model-en-us-0.22.zip")
@@ -18,11 +62,17 @@ def download_vosk_model():
     print("Downloading Vosk model (vosk-model-en-us-0.22)... This may take a while (1.8GB).")
 
     try:
-        urllib.request.urlretrieve(url, zip_path)
-        print("Download complete. Extracting...")
+        _download(url, zip_path)
+        print("Download complete. Verifying...")
+
+        digest = _sha256_file(zip_path)
+        print(f"SHA-256: {digest}")
+        if MODEL_SHA256 and digest != MODEL_SHA256.lower():
+            raise ValueError(f"Checksum mismatch, expected {MODEL_SHA256}")
+
+        print("Extracting...")
 
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(model_dir)
+        _extract(zip_path, model_dir)
 
         # Remove the zip file
         os.remove(zip_path)
@@ -3,15 +3,22 @@
 Audio Capture Module for Larynx ASR Tool.
 
 Handles continuous microphone recording with proper parameters for Vosk.
-Implements thread-safe audio queue for real-time processing.
+Implements a lock-free audio ring buffer for real-time processing.
 """
 
-import pyaudio
-import queue
+import sounddevice as sd
 import threading
 import time
 import numpy as np
 
+try:
+    from .spsc_ring import SPSCRing
+except ImportError:
+    from spsc_ring import SPSCRing
+
+# Number of ring slots and preallocated chunk buffers (power of two)
+RING_SIZE = 128
+
 class AudioCapture:
     """
     Audio capture class for continuous microphone recording.
@@ -34,13 +41,18 @@ class AudioCapture:
         self.device_index = device_index
 
         # Audio components
-        self.audio = None
         self.stream = None
-        self.audio_queue = queue.Queue(maxsize=100)  # Thread-safe queue
+        self.audio_queue = SPSCRing(RING_SIZE)  # Lock-free ring of pool slot indices
 
-        # Threading
-        self.recording_thread = None
-        self.is_recording_flag = False
+        # Preallocated chunk buffers; the ring only carries slot indices, so
+        # publishing a chunk allocates nothing on the audio thread
+        self._pool = [bytearray(chunk_size * 2) for _ in range(RING_SIZE)]
+        self._views = [memoryview(buf) for buf in self._pool]
+        self._write_slot = 0
+        self.dropped_chunks = 0  # Chunks lost to a full ring (written by the callback only)
+
+        # Recording state
+        self.recording_event = threading.Event()
 
         # Auto-select device if not specified
         if self.device_index is None:
@@ -49,16 +61,12 @@ class AudioCapture:
     def _select_preferred_device(self):
         """Select the best available input device (prioritize PulseAudio)."""
         try:
-            temp_audio = pyaudio.PyAudio()
             devices = []
 
-            for i in range(temp_audio.get_device_count()):
-                device_info = temp_audio.get_device_info_by_index(i)
-                if device_info.get('maxInputChannels') > 0:
+            for i, device_info in enumerate(sd.query_devices()):
+                if device_info.get('max_input_channels') > 0:
                     devices.append((i, device_info))
 
-            temp_audio.terminate()
-
             # Prefer PulseAudio device
             preferred_patterns = ['pulse', 'default', 'sysdefault']
             for pattern in preferred_patterns:
@@ -74,84 +82,78 @@ class AudioCapture:
             print(f"Warning: Could not select device: {e}")
             return None
 
-    def _recording_worker(self):
-        """Worker thread for continuous audio recording."""
-        try:
-            self.audio = pyaudio.PyAudio()
-            self.stream = self.audio.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=self.sample_rate,
-                input=True,
-                input_device_index=self.device_index,
-                frames_per_buffer=self.chunk_size
-            )
-
-            print(f"🎤 Started recording on device {self.device_index} at {self.sample_rate}Hz")
-
-            while self.is_recording_flag:
-                try:
-                    # Read audio chunk
-                    data = self.stream.read(self.chunk_size, exception_on_overflow=False)
+    def _audio_callback(self, indata, frames, time_info, status):
+        """
+        PortAudio stream callback, runs on the audio thread.
 
-                    # Put in queue (non-blocking, drop if full to avoid lag)
-                    try:
-                        self.audio_queue.put(data, timeout=0.1)
-                    except queue.Full:
-                        # Remove oldest chunk if queue is full
-                        try:
-                            self.audio_queue.get_nowait()
-                            self.audio_queue.put(data, timeout=0.1)
-                        except:
-                            pass  # Skip if can't manage queue
+        Must not print, log or allocate: it only copies the block into a
+        pool slot and publishes the slot index.
+        """
+        # Drop the chunk if full: the free slot may still be
+        # in use by the consumer that just popped it
+        if self.audio_queue.full():
+            self.dropped_chunks += 1
+            return
 
-                except Exception as e:
-                    print(f"Audio read error: {e}")
-                    time.sleep(0.01)  # Brief pause on error
-
-        except Exception as e:
-            print(f"Recording thread error: {e}")
-        finally:
-            self._cleanup()
+        slot = self._write_slot
+        self._views[slot][:] = indata
+        self.audio_queue.push(slot)
+        self._write_slot = (slot + 1) & (RING_SIZE - 1)
 
     def _cleanup(self):
         """Clean up audio resources."""
         try:
             if self.stream:
-                self.stream.stop_stream()
+                self.stream.stop()
                 self.stream.close()
-            if self.audio:
-                self.audio.terminate()
         except Exception as e:
             print(f"Cleanup error: {e}")
+        finally:
+            self.stream = None
 
     def start_recording(self):
-        """Start continuous audio recording in a background thread."""
-        if self.is_recording_flag:
+        """Start continuous audio recording via a PortAudio callback stream."""
+        if self.recording_event.is_set():
             print("Already recording")
             return
 
-        self.is_recording_flag = True
-        self.recording_thread = threading.Thread(target=self._recording_worker, daemon=True)
-        self.recording_thread.start()
+        self.dropped_chunks = 0
+
+        try:
+            self.stream = sd.RawInputStream(
+                samplerate=self.sample_rate,
+                blocksize=self.chunk_size,
+                dtype='int16',
+                channels=1,
+                device=self.device_index,
+                callback=self._audio_callback
+            )
+            self.stream.start()
+        except Exception as e:
+            print(f"Recording start error: {e}")
+            self._cleanup()
+            return
+
+        self.recording_event.set()
+        print(f"🎤 Started recording on device {self.device_index} at {self.sample_rate}Hz")
 
     def stop_recording(self):
         """Stop audio recording and clean up."""
-        if not self.is_recording_flag:
+        if not self.recording_event.is_set():
             return
 
         print("🛑 Stopping recording...")
-        self.is_recording_flag = False
-
-        if self.recording_thread:
-            self.recording_thread.join(timeout=2.0)
+        self.recording_event.clear()
 
         self._cleanup()
-        print("Recording stopped")
+        if self.dropped_chunks:
+            print(f"Recording stopped ({self.dropped_chunks} chunks dropped, consumer too slow)")
+        else:
+            print("Recording stopped")
 
     def get_audio_chunk(self, timeout=0.1):
         """
-        Get the next audio chunk from the queue.
+        Get the next audio chunk from the ring buffer.
 
         Args:
             timeout (float): Timeout in seconds to wait for chunk
@@ -159,26 +161,23 @@ class AudioCapture:
         Returns:
             bytes: Audio data chunk, or None if no data available
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
+        slot = self.audio_queue.get(timeout=timeout)
+        if slot is None:
             return None
+        # Vosk needs bytes; copy out here, off the audio thread
+        return bytes(self._pool[slot])
 
     def is_recording(self):
         """Check if currently recording."""
-        return self.is_recording_flag
+        return self.recording_event.is_set()
 
     def get_queue_size(self):
         """Get current queue size (for debugging)."""
-        return self.audio_queue.qsize()
+        return len(self.audio_queue)
 
     def clear_queue(self):
         """Clear all pending audio chunks from queue."""
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.audio_queue.clear()
 
 
 # Test function for standalone testing
@@ -193,21 +192,24 @@ def test_audio_capture():
 
     chunks_received = 0
     start_time = time.time()
+    int16 = np.int16  # Hoisted out of the per-chunk loop
 
     while time.time() - start_time < 5:
         chunk = capture.get_audio_chunk(timeout=0.1)
         if chunk:
             chunks_received += 1
-            # Convert to numpy for analysis
-            audio_data = np.frombuffer(chunk, dtype=np.int16)
-            max_amp = np.max(np.abs(audio_data))
-            print(".1f")
+            # Per-chunk analysis: view the bytes without copying and use
+            # whole-array reductions; avoid np.abs(), which allocates a
+            # temporary (and wraps -32768 back to itself for int16)
+            audio_data = np.frombuffer(chunk, dtype=int16)
+            max_amp = max(int(audio_data.max()), -int(audio_data.min()))
+            print(f"Chunk {chunks_received}: max amplitude {max_amp}")
 
     capture.stop_recording()
 
     print(f"Test complete. Received {chunks_received} chunks in 5 seconds")
     expected_chunks = 5 / (capture.chunk_size / capture.sample_rate)
-    print(".1f")
+    print(f"Expected about {expected_chunks:.1f} chunks")
 
 
 if __name__ == "__main__":
@@ -10,6 +10,24 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
 import time
+import weakref
+
+# Theme colors (dark mode)
+COLORS = {
+    'bg': '#2b2b2b',           # Dark background
+    'fg': '#ffffff',           # Light text
+    'accent': '#007acc',       # Blue accent
+    'accent_hover': '#005999', # Darker blue
+    'secondary': '#404040',    # Dark gray
+    'text_bg': '#1e1e1e',      # Text area background
+    'button_bg': '#404040',    # Button background
+    'recording': '#ff6b6b',    # Red for recording
+    'idle': '#4ecdc4'          # Teal for idle
+}
+
+# Roots whose ttk styles are already configured. Styles live in each Tk
+# interpreter, so they are set up once per root rather than per LarynxGUI.
+_STYLED_ROOTS = weakref.WeakSet()
 
 class LarynxGUI:
     """
@@ -31,17 +49,7 @@ class LarynxGUI:
         self.root.minsize(600, 400)
 
         # Theme colors (dark mode)
-        self.colors = {
-            'bg': '#2b2b2b',           # Dark background
-            'fg': '#ffffff',           # Light text
-            'accent': '#007acc',       # Blue accent
-            'accent_hover': '#005999', # Darker blue
-            'secondary': '#404040',    # Dark gray
-            'text_bg': '#1e1e1e',      # Text area background
-            'button_bg': '#404040',    # Button background
-            'recording': '#ff6b6b',    # Red for recording
-            'idle': '#4ecdc4'          # Teal for idle
-        }
+        self.colors = COLORS
 
         # Configure root
         self.root.configure(bg=self.colors['bg'])
@@ -51,6 +59,14 @@ class LarynxGUI:
         self.is_recording = False
         self.word_count = 0
 
+        # Pending display changes, flushed at most once per idle cycle
+        self._pending_lock = threading.Lock()
+        self._pending_text = None
+        self._pending_deltas = []
+        self._pending_partial = None
+        self._pending_word_count = None
+        self._redraw_scheduled = False
+
         # Create widgets
         self.create_widgets()
 
@@ -58,31 +74,36 @@ class LarynxGUI:
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
     def _setup_styles(self):
-        """Configure ttk styles for modern appearance."""
-        style = ttk.Style()
+        """Configure ttk styles for modern appearance (once per Tk root)."""
+        if self.root in _STYLED_ROOTS:
+            return
+
+        style = ttk.Style(self.root)
 
         # Button style
         style.configure('Modern.TButton',
-                       background=self.colors['button_bg'],
-                       foreground=self.colors['fg'],
+                       background=COLORS['button_bg'],
+                       foreground=COLORS['fg'],
                        borderwidth=0,
                        focusthickness=0,
                        relief='flat',
                        font=('Segoe UI', 10, 'bold'))
 
         style.map('Modern.TButton',
-                 background=[('active', self.colors['accent_hover']),
-                           ('pressed', self.colors['accent'])])
+                 background=[('active', COLORS['accent_hover']),
+                           ('pressed', COLORS['accent'])])
 
         # Label style
         style.configure('Modern.TLabel',
-                       background=self.colors['bg'],
-                       foreground=self.colors['fg'],
+                       background=COLORS['bg'],
+                       foreground=COLORS['fg'],
                        font=('Segoe UI', 10))
 
         # Frame style
         style.configure('Modern.TFrame',
-                       background=self.colors['bg'])
+                       background=COLORS['bg'])
+
+        _STYLED_ROOTS.add(self.root)
 
     def create_widgets(self):
         """Create and layout all GUI widgets."""
@@ -204,26 +225,103 @@ class LarynxGUI:
 
     def update_text_display(self, text):
         """
-        Update the transcription text display.
+        Replace the whole transcription text display.
 
         Args:
             text (str): New text to display
         """
-        def update():
-            self.text_area.config(state='normal')
+        with self._pending_lock:
+            # A full replace supersedes any appends still waiting
+            self._pending_text = text
+            self._pending_deltas = []
+            self._pending_partial = None
+        self._schedule_flush()
+
+    def append_final(self, delta):
+        """
+        Append newly confirmed text to the display.
+
+        Args:
+            delta (str): Final text added since the previous update
+        """
+        with self._pending_lock:
+            self._pending_deltas.append(delta)
+        self._schedule_flush()
+
+    def set_partial(self, text):
+        """
+        Replace the in-progress partial text at the end of the display.
+
+        Args:
+            text (str): Current partial text (empty to remove it)
+        """
+        with self._pending_lock:
+            self._pending_partial = text
+        self._schedule_flush()
+
+    def set_word_count(self, count):
+        """
+        Update the word count shown in the status bar.
+
+        Args:
+            count (int): Word count as tracked by the text buffer
+        """
+        with self._pending_lock:
+            self._pending_word_count = count
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Schedule at most one display redraw per Tk idle cycle."""
+        with self._pending_lock:
+            if self._redraw_scheduled:
+                return
+            self._redraw_scheduled = True
+
+        # Schedule update on main thread
+        self.root.after_idle(self._flush_text)
+
+    def _flush_text(self):
+        """Apply all pending text changes in one redraw (main thread)."""
+        with self._pending_lock:
+            text = self._pending_text
+            deltas = self._pending_deltas
+            partial = self._pending_partial
+            word_count = self._pending_word_count
+            self._pending_text = None
+            self._pending_deltas = []
+            self._pending_partial = None
+            self._pending_word_count = None
+            self._redraw_scheduled = False
+
+        self.text_area.config(state='normal')
+
+        if text is not None:
             self.text_area.delete(1.0, tk.END)
             self.text_area.insert(tk.END, text)
-            self.text_area.config(state='disabled')
 
-            # Auto-scroll to bottom
-            self.text_area.see(tk.END)
+        if deltas:
+            self._delete_partial()
+            self.text_area.insert(tk.END, "".join(deltas))
+
+        if partial is not None:
+            self._delete_partial()
+            if partial:
+                self.text_area.insert(tk.END, partial, "partial")
 
-            # Update word count
-            self.word_count = len(text.split()) if text.strip() else 0
+        self.text_area.config(state='disabled')
+
+        # Auto-scroll to bottom
+        self.text_area.see(tk.END)
+
+        if word_count is not None:
+            self.word_count = word_count
             self._update_status_text()
 
-        # Schedule update on main thread
-        self.root.after(0, update)
+    def _delete_partial(self):
+        """Remove the text range tagged as partial, if any."""
+        ranges = self.text_area.tag_ranges("partial")
+        if ranges:
+            self.text_area.delete(ranges[0], ranges[-1])
 
     def _update_status_text(self):
         """Update the status label text."""
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Single-Producer/Single-Consumer Ring Buffer for Larynx ASR Tool.
+
+Lock-free fixed-size ring used to hand audio chunks from the capture
+thread to the consumer without taking a mutex on the hot path.
+"""
+
+import threading
+
+class SPSCRing:
+    """
+    Fixed-size lock-free ring buffer for exactly one producer and one consumer.
+
+    The producer only ever writes ``_head`` and the consumer only ever writes
+    ``_tail``; both are plain ints, so each update is a single atomic store.
+    One slot is kept free to distinguish full from empty, so the usable
+    capacity is ``size - 1``.
+    """
+
+    def __init__(self, size=128):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            size (int): Number of slots, must be a power of two (default: 128)
+        """
+        if size < 2 or size & (size - 1):
+            raise ValueError(f"Ring size must be a power of two, got {size}")
+
+        self._buf = [None] * size
+        self._mask = size - 1
+        self._head = 0  # Next slot to write (producer only)
+        self._tail = 0  # Next slot to read (consumer only)
+
+        # Wakes a blocked consumer; set when a push lands in an empty ring
+        self._not_empty = threading.Event()
+
+    def push(self, item):
+        """
+        Publish an item (producer side).
+
+        Args:
+            item: Object to publish
+
+        Returns:
+            bool: True if published, False if the ring is full
+        """
+        head = self._head
+        next_head = (head + 1) & self._mask
+        if next_head == self._tail:
+            return False
+
+        self._buf[head] = item
+        self._head = next_head
+
+        # Checked after publishing: if the consumer has drained up to this
+        # slot it may be blocked in get(), even if the ring looked non-empty
+        # before the store, so wake it
+        if self._tail == head:
+            self._not_empty.set()
+        return True
+
+    def pop(self):
+        """
+        Take the oldest item without blocking (consumer side).
+
+        Returns:
+            The oldest item, or None if the ring is empty
+        """
+        tail = self._tail
+        if tail == self._head:
+            return None
+
+        item = self._buf[tail]
+        self._buf[tail] = None
+        self._tail = (tail + 1) & self._mask
+        return item
+
+    def get(self, timeout=None):
+        """
+        Take the oldest item, waiting up to ``timeout`` for one (consumer side).
+
+        Args:
+            timeout (float): Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            The oldest item, or None if nothing arrived in time
+        """
+        item = self.pop()
+        if item is not None:
+            return item
+
+        # Clear then re-check so a push racing with the clear is not missed
+        self._not_empty.clear()
+        item = self.pop()
+        if item is not None:
+            return item
+
+        self._not_empty.wait(timeout)
+        return self.pop()
+
+    def clear(self):
+        """
+        Drop all pending items (consumer side).
+
+        A single store of the tail index; stale slot references are simply
+        overwritten when the producer reuses the slots.
+        """
+        self._tail = self._head
+
+    def full(self):
+        """Check if the ring has no free slot."""
+        return ((self._head + 1) & self._mask) == self._tail
+
+    def empty(self):
+        """Check if the ring holds no items."""
+        return self._head == self._tail
+
+    def __len__(self):
+        """Get the number of items currently in the ring."""
+        return (self._head - self._tail) & self._mask
+
+
+# Test function for standalone testing
+def test_spsc_ring():
+    """Test the ring buffer, including the blocking get() path."""
+    import time
+
+    print("Testing SPSCRing...")
+
+    ring = SPSCRing(4)
+    print(f"Pushed 3 items: {[ring.push(i) for i in range(3)]}")
+    print(f"Push into full ring: {ring.push(3)} (expected False)")
+    print(f"Popped: {[ring.pop() for _ in range(3)]}, then {ring.pop()}")
+
+    # Blocking get: the consumer must wake for every item, with no timeout
+    item_count = 20000
+    ring = SPSCRing(8)
+    received = []
+
+    def consumer():
+        for _ in range(item_count):
+            received.append(ring.get(timeout=None))
+
+    thread = threading.Thread(target=consumer, daemon=True)
+    thread.start()
+    for i in range(item_count):
+        while not ring.push(i):
+            time.sleep(0)  # Ring full, let the consumer run
+    thread.join(timeout=10.0)
+
+    if thread.is_alive():
+        print(f"❌ Consumer stuck in get() with {len(ring)} items in the ring")
+    elif received == list(range(item_count)):
+        print(f"✅ Blocking get() received all {item_count} items in order")
+    else:
+        print(f"❌ Received {len(received)} items, order or content wrong")
+
+    print("SPSCRing test complete")
+
+
+if __name__ == "__main__":
+    test_spsc_ring()
@@ -8,6 +8,27 @@ partial and final results, text formatting, and thread-safe operations.
 
 import threading
 import re
+from collections import namedtuple
+
+# Precompiled pattern for the per-partial hot path
+_SENT_RE = re.compile(r'([.!?]\s*)([a-z])')
+
+# Immutable buffer snapshot, replaced wholesale by each write; version
+# increases on every change so consumers can skip re-reading unchanged text
+_State = namedtuple('_State', 'final partial final_words partial_words version')
+_EMPTY_STATE = _State((), "", 0, 0, 0)
+
+def _upper_after_sentence(match):
+    """Replacement for _SENT_RE: keep the punctuation, uppercase the letter."""
+    return match.group(1) + match.group(2).upper()
+
+def _capitalize_sentences(text):
+    """Uppercase the first letter after each '.', '!' or '?'."""
+    # Vosk output is usually unpunctuated, so the cheap C-level membership
+    # tests let most calls skip the regex pass entirely
+    if '.' in text or '!' in text or '?' in text:
+        return _SENT_RE.sub(_upper_after_sentence, text)
+    return text
 
 class TextBuffer:
     """
@@ -15,14 +36,56 @@ class TextBuffer:
 
     Handles partial results (real-time updates) and final results (confirmed text),
     with automatic formatting and deduplication.
+
+    Writers publish the whole buffer state as one immutable ``_State``
+    with a single attribute assignment. Readers snapshot it without
+    locking, so UI polls never block on, or are blocked by, the ASR thread.
+
+    The ASR thread is the only regular writer. The lock is kept for writes
+    only because clear() can also be called from the Tk thread (Clear
+    button) while a recording is running.
     """
 
-    def __init__(self):
-        """Initialize the text buffer."""
-        self.lock = threading.Lock()
-        self.final_text = ""  # Confirmed, immutable text
-        self.partial_text = ""  # Current partial result (may change)
+    # Fixed attribute layout: no per-instance dict, faster attribute access
+    __slots__ = ('lock', 'max_history', 'last_partial_length', 'sent_final_chunks',
+                 '_dropped_finals', '_evicted_sentence_end', '_state',
+                 '_full_cache', '_final_cache')
+
+    def __init__(self, max_history=None):
+        """
+        Initialize the text buffer.
+
+        Args:
+            max_history (int): Keep only the most recent final chunks (one per
+                Vosk final result); older ones are dropped from the buffer text
+                and word count. None keeps the whole session (default: None).
+                Finals evicted before pop_new_finals() handed them out are
+                never returned by it, so callers rendering deltas should pop
+                at least once every ``max_history`` finals
+        """
+        if max_history is not None and max_history < 1:
+            raise ValueError(f"max_history must be positive, got {max_history}")
+
+        self.lock = threading.Lock()  # Serializes writers only; readers never take it
+        self.max_history = max_history
         self.last_partial_length = 0  # Track partial text length for deduplication
+        self.sent_final_chunks = 0  # Final chunks ever handed out as deltas
+        self._dropped_finals = 0  # Final chunks ever evicted by max_history
+        self._evicted_sentence_end = True  # Last evicted chunk ended a sentence
+
+        # Published state: confirmed text (one entry per final), current
+        # partial result, and word counts kept for O(1) get_word_count
+        self._state = _EMPTY_STATE
+
+        # Formatted output caches, each a (key, text) pair published in one
+        # assignment; the key is the state (or final tuple) it was built from
+        self._full_cache = (None, "")
+        self._final_cache = (None, "")
+
+    @property
+    def partial_text(self):
+        """Current partial result (may change)."""
+        return self._state.partial
 
     def add_partial_text(self, text):
         """
@@ -32,12 +95,12 @@ class TextBuffer:
             text (str): New partial text from ASR engine
         """
         with self.lock:
-            if text:
-                # Clean and format the partial text
-                cleaned = self._clean_text(text)
-                self.partial_text = cleaned
-            else:
-                self.partial_text = ""
+            finals, partial, final_words, _, version = self._state
+            # Clean and format the partial text
+            cleaned = self._clean_text(text) if text else ""
+            if cleaned != partial:
+                self._state = _State(finals, cleaned, final_words,
+                                     len(cleaned.split()), version + 1)
 
     def add_final_text(self, text):
         """
@@ -48,10 +111,21 @@ class TextBuffer:
         """
         with self.lock:
             if text:
+                finals, partial, final_words, _, version = self._state
                 cleaned = self._clean_text(text)
-                self.final_text += cleaned + " "
+                if cleaned:
+                    finals = finals + (cleaned,)
+                    final_words += len(cleaned.split())
+                    if self.max_history is not None and len(finals) > self.max_history:
+                        # Bounded history: evict the oldest chunk(s)
+                        evicted = len(finals) - self.max_history
+                        final_words -= sum(len(c.split()) for c in finals[:evicted])
+                        self._evicted_sentence_end = finals[evicted - 1][-1] in '.!?'
+                        finals = finals[evicted:]
+                        self._dropped_finals += evicted
                 # Clear partial after committing
-                self.partial_text = ""
+                if cleaned or partial:
+                    self._state = _State(finals, "", final_words, 0, version + 1)
 
     def get_full_text(self):
         """
@@ -60,9 +134,18 @@ class TextBuffer:
         Returns:
             str: All final text plus current partial text
         """
-        with self.lock:
-            full_text = self.final_text + self.partial_text
-            return self._format_text(full_text.strip())
+        state = self._state
+        key, cached = self._full_cache
+        if key is state:
+            return cached
+
+        finals, partial = state.final, state.partial
+        full_text = " ".join(finals)
+        if partial:
+            full_text = f"{full_text} {partial}"
+        formatted = self._format_text(full_text)
+        self._full_cache = (state, formatted)
+        return formatted
 
     def get_final_text_only(self):
         """
@@ -71,8 +154,48 @@ class TextBuffer:
         Returns:
             str: Formatted final text only
         """
+        finals = self._state.final
+        key, cached = self._final_cache
+        if key is finals:
+            return cached
+
+        formatted = self._format_text(" ".join(finals))
+        self._final_cache = (finals, formatted)
+        return formatted
+
+    def pop_new_finals(self):
+        """
+        Get the formatted final text added since the previous call.
+
+        Lets the display append only what is new instead of re-rendering
+        the whole transcript on every update.
+
+        Returns:
+            str: Formatted new final text (with trailing space), or empty string
+        """
         with self.lock:
-            return self._format_text(self.final_text.strip())
+            finals = self._state.final
+            # sent_final_chunks counts every chunk sent, including evicted ones
+            start = max(self.sent_final_chunks - self._dropped_finals, 0)
+            new_chunks = finals[start:]
+            if not new_chunks:
+                return ""
+            self.sent_final_chunks = self._dropped_finals + len(finals)
+            delta = " ".join(new_chunks) + " "
+            if start == 0 and self._dropped_finals:
+                # The text before this delta was evicted but is still on screen
+                return self._format_delta(delta, self._evicted_sentence_end)
+            return self._format_delta(delta, self._at_sentence_start(finals, start))
+
+    def get_formatted_partial(self):
+        """
+        Get the current partial text formatted to follow the final text.
+
+        Returns:
+            str: Formatted partial text
+        """
+        finals, partial = self._state[:2]
+        return self._format_delta(partial, self._at_sentence_start(finals, len(finals)))
 
     def get_partial_text_only(self):
         """
@@ -81,15 +204,17 @@ class TextBuffer:
         Returns:
             str: Current partial text
         """
-        with self.lock:
-            return self.partial_text
+        return self._state.partial
 
     def clear(self):
         """Clear all text from the buffer."""
         with self.lock:
-            self.final_text = ""
-            self.partial_text = ""
+            # Keep counting up so a cleared buffer never reuses a version
+            self._state = _EMPTY_STATE._replace(version=self._state.version + 1)
             self.last_partial_length = 0
+            self.sent_final_chunks = 0
+            self._dropped_finals = 0
+            self._evicted_sentence_end = True
 
     def _clean_text(self, text):
         """
@@ -104,8 +229,8 @@ class TextBuffer:
         if not text:
             return ""
 
-        # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', text.strip())
+        # Strip and collapse whitespace runs with C-level split/join
+        cleaned = " ".join(text.split())
 
         # Remove common ASR artifacts (if any)
         # Add more cleaning rules as needed
@@ -125,27 +250,69 @@ class TextBuffer:
         if not text:
             return ""
 
-        # Ensure single space between words
-        formatted = re.sub(r'\s+', ' ', text.strip())
+        # Strip and ensure single space between words in one split/join
+        formatted = " ".join(text.split())
+        if not formatted:
+            return ""
+
+        # Capitalize first letter of text, then after sentence endings
+        return _capitalize_sentences(formatted[0].upper() + formatted[1:])
+
+    def _at_sentence_start(self, finals, end):
+        """
+        Check if text appended after the first ``end`` final chunks starts a sentence.
+
+        Args:
+            finals (tuple): Final chunks snapshot
+            end (int): Number of final chunks before the new text
+
+        Returns:
+            bool: True if at the very start or after closing punctuation
+        """
+        # Chunks are cleaned and non-empty, so [-1] is the last real char
+        return end == 0 or finals[end - 1][-1] in '.!?'
+
+    def _format_delta(self, text, at_sentence_start):
+        """
+        Format a piece of text that will be appended to already shown text.
+
+        Args:
+            text (str): Cleaned text to format
+            at_sentence_start (bool): Capitalize the first letter
+
+        Returns:
+            str: Formatted text
+        """
+        if not text:
+            return ""
 
-        # Capitalize first letter of text
-        if formatted:
-            formatted = formatted[0].upper() + formatted[1:]
+        if at_sentence_start:
+            text = text[0].upper() + text[1:]
 
         # Capitalize after sentence endings
-        formatted = re.sub(r'([.!?]\s*)([a-z])', lambda m: m.group(1) + m.group(2).upper(), formatted)
+        return _capitalize_sentences(text)
 
-        return formatted
+    def get_version(self):
+        """
+        Get the buffer version, which increases whenever the text changes.
+
+        Consumers can remember the version they last rendered and skip
+        fetching text while it is unchanged.
+
+        Returns:
+            int: Current buffer version
+        """
+        return self._state.version
 
     def get_word_count(self):
         """
-        Get the total word count of final text.
+        Get the total word count of final plus current partial text.
 
         Returns:
-            int: Number of words in final text
+            int: Number of words in the transcription
         """
-        with self.lock:
-            return len(self.final_text.split())
+        state = self._state
+        return state.final_words + state.partial_words
 
     def is_empty(self):
         """
@@ -154,8 +321,8 @@ class TextBuffer:
         Returns:
             bool: True if no text in buffer
         """
-        with self.lock:
-            return not self.final_text and not self.partial_text
+        finals, partial = self._state[:2]
+        return not finals and not partial
 
 
 # Test function for standalone testing
@@ -178,6 +345,7 @@ def test_text_buffer():
     print("Adding final text: 'hello world'")
     buffer.add_final_text("hello world")
     print(f"Full text: '{buffer.get_full_text()}'")
+    print(f"New finals: '{buffer.pop_new_finals()}'")
 
     # Test more text
     print("Adding partial text: 'how are'")
@@ -187,6 +355,7 @@ def test_text_buffer():
     print("Adding final text: 'how are you'")
     buffer.add_final_text("how are you")
     print(f"Full text: '{buffer.get_full_text()}'")
+    print(f"New finals: '{buffer.pop_new_finals()}'")
 
     # Test formatting
     print("Adding final text: 'this is a test. hello world'")
@@ -199,6 +368,18 @@ def test_text_buffer():
     buffer.clear()
     print(f"After clear: '{buffer.get_full_text()}'")
 
+    # Test bounded history
+    print("Bounded history (max_history=1)...")
+    bounded = TextBuffer(max_history=1)
+    bounded.add_final_text("hello there.")
+    print(f"New finals: '{bounded.pop_new_finals()}'")
+    bounded.add_final_text("how are you")
+    print(f"New finals: '{bounded.pop_new_finals()}'")  # 'How are you ' after the evicted '.'
+    bounded.add_final_text("not popped")
+    bounded.add_final_text("fine thanks")
+    print(f"New finals: '{bounded.pop_new_finals()}'")  # 'not popped' was evicted unsent
+    print(f"Full text: '{bounded.get_full_text()}', words: {bounded.get_word_count()}")
+
     print("TextBuffer test complete")
 
 
@@ -7,10 +7,31 @@ Provides streaming recognition with partial and final results.
 """
 
 import os
-import json
 import vosk
 import time
 
+try:
+    # Native parser, several times faster than json for Vosk's small results
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+# Smallest buffer handed to AcceptWaveform: 250 ms of 16 kHz mono int16
+BATCH_BYTES = 8000
+
+def _result_text(payload, key):
+    """
+    Extract the stripped text field from a Vosk JSON result.
+
+    Args:
+        payload (str): JSON string from Result()/PartialResult()
+        key (str): 'text' for final results, 'partial' for partial ones
+
+    Returns:
+        str: Recognized text, or empty string
+    """
+    return loads(payload).get(key, '').strip()
+
 class VoskEngine:
     """
     Vosk-based speech recognition engine.
@@ -30,6 +51,9 @@ class VoskEngine:
         self.model = None
         self.recognizer = None
         self.is_active = False
+        self._last_partial_raw = None  # Previous PartialResult() JSON, to skip repeats
+        self._pending = bytearray()  # Audio held back until a full batch is buffered
+        self._batch_bytes = BATCH_BYTES
 
         # Load model on initialization
         self._load_model()
@@ -59,6 +83,8 @@ class VoskEngine:
 
         # Create recognizer with 16kHz sample rate
         self.recognizer = vosk.KaldiRecognizer(self.model, 16000)
+        self._last_partial_raw = None
+        self._pending.clear()
         self.is_active = True
         print("Vosk recognizer started")
 
@@ -66,37 +92,79 @@ class VoskEngine:
         """
         Process audio chunk and return any recognition results.
 
+        Chunks shorter than a batch are buffered and decoded together once
+        ``BATCH_BYTES`` have accumulated; use flush() to decode the remainder.
+
         Args:
-            audio_data (bytes): Raw audio data (16-bit PCM, 16kHz, mono)
+            audio_data (bytes | bytearray | memoryview | numpy.ndarray): Raw audio
+                data (16-bit PCM, 16kHz, mono); bytes is passed through as-is
 
         Returns:
             dict: Recognition results with keys:
-                - 'partial': str or None (real-time partial transcription)
+                - 'partial': str or None (real-time partial transcription,
+                  None when unchanged since the previous call)
                 - 'final': str or None (confirmed final text)
         """
         if not self.is_active or self.recognizer is None:
             return {'partial': None, 'final': None}
 
-        results = {'partial': None, 'final': None}
+        if not isinstance(audio_data, bytes):
+            # The cffi binding takes a char* plus len(data), so other buffers
+            # (an int16 array's len() counts samples) are flattened to bytes
+            audio_data = memoryview(audio_data).cast('B').tobytes()
+
+        if self._pending or len(audio_data) < self._batch_bytes:
+            # Full-size chunks skip this copy; short ones wait for a batch
+            self._pending += audio_data
+            if len(self._pending) < self._batch_bytes:
+                return {'partial': None, 'final': None}
+            audio_data = bytes(self._pending)
+            self._pending.clear()
 
+        return self._accept(audio_data)
+
+    def flush(self):
+        """
+        Decode any buffered audio shorter than a batch.
+
+        Returns:
+            dict: Recognition results, same keys as process_audio()
+        """
+        if not self._pending or not self.is_active or self.recognizer is None:
+            return {'partial': None, 'final': None}
+
+        audio_data = bytes(self._pending)
+        self._pending.clear()
+        return self._accept(audio_data)
+
+    def _accept(self, audio_data):
+        """
+        Feed one buffer to the recognizer and collect its results.
+
+        Args:
+            audio_data (bytes): Raw audio data (16-bit PCM, 16kHz, mono)
+
+        Returns:
+            dict: Recognition results, same keys as process_audio()
+        """
         try:
-            # Feed audio data to recognizer
+            # Feed audio data to recognizer (cffi call, decodes with the GIL released)
             if self.recognizer.AcceptWaveform(audio_data):
-                # Final result available
-                result_json = self.recognizer.Result()
-                result = json.loads(result_json)
-                results['final'] = result.get('text', '').strip()
-            else:
-                # Partial result
-                partial_json = self.recognizer.PartialResult()
-                partial = json.loads(partial_json)
-                results['partial'] = partial.get('partial', '').strip()
+                # Final result available; the next utterance starts a fresh partial
+                self._last_partial_raw = None
+                return {'partial': None, 'final': _result_text(self.recognizer.Result(), 'text')}
+
+            # Partial result, skipped without parsing if Vosk repeated itself
+            raw = self.recognizer.PartialResult()
+            if raw == self._last_partial_raw:
+                return {'partial': None, 'final': None}
+            self._last_partial_raw = raw
+            return {'partial': _result_text(raw, 'partial'), 'final': None}
 
         except Exception as e:
             print(f"Vosk processing error: {e}")
             # Continue processing despite errors
-
-        return results
+            return {'partial': None, 'final': None}
 
     def get_partial_result(self):
         """
@@ -109,9 +177,7 @@ class VoskEngine:
             return ""
 
         try:
-            partial_json = self.recognizer.PartialResult()
-            partial = json.loads(partial_json)
-            return partial.get('partial', '').strip()
+            return _result_text(self.recognizer.PartialResult(), 'partial')
         except Exception as e:
             print(f"Error getting partial result: {e}")
             return ""
@@ -126,10 +192,12 @@ class VoskEngine:
         if not self.is_active or self.recognizer is None:
             return ""
 
+        # Buffered audio may itself complete an utterance
+        flushed = self.flush()['final']
+
         try:
-            result_json = self.recognizer.Result()
-            result = json.loads(result_json)
-            return result.get('text', '').strip()
+            text = _result_text(self.recognizer.Result(), 'text')
+            return f"{flushed} {text}".strip() if flushed else text
         except Exception as e:
             print(f"Error getting final result: {e}")
             return ""
@@ -168,8 +236,7 @@ def test_vosk_engine():
     print(f"Results: {results}")
 
     # Test with some noise (random data)
-    import random
-    noise_data = bytes([random.randint(0, 255) for _ in range(samples * 2)])
+    noise_data = os.urandom(samples * 2)
     print("Processing 1 second of noise...")
     results = engine.process_audio(noise_data)
     print(f"Results: {results}")
@@ -15,6 +15,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from audio_capture import AudioCapture
 from vosk_engine import VoskEngine
 
+# Per-chunk debug output; off by default so the loop does no formatting
+DEBUG = False
+
 def test_audio_to_text():
     """Test end-to-end audio capture to text transcription."""
     print("🎤 Testing Audio Capture + Vosk ASR Integration")
@@ -41,14 +44,14 @@ def test_audio_to_text():
 
     try:
         while time.time() - start_time < 10:  # 10 seconds test
-            # Get audio chunk
+            # Get audio chunk (blocks up to the timeout, so no extra sleep)
             chunk = capture.get_audio_chunk(timeout=0.1)
             if chunk:
                 # Process with Vosk
                 results = engine.process_audio(chunk)
-                
-                # Debug: print chunk info
-                print(f"Chunk: {len(chunk)} bytes, Partial: '{results['partial']}', Final: '{results['final']}'")
+
+                if DEBUG:
+                    print(f"Chunk: {len(chunk)} bytes, Partial: '{results['partial']}', Final: '{results['final']}'")
                 
                 # Handle partial results
                 if results['partial'] and results['partial'] != partial_text:
@@ -62,8 +65,6 @@ def test_audio_to_text():
                     # Reset partial after final
                     partial_text = ""
 
-            time.sleep(0.01)  # Small delay to prevent busy loop
-
     except KeyboardInterrupt:
         print("\n⏹️  Test interrupted by user")
 
@@ -57,24 +57,22 @@ def test_microphone(device_index=None):
             print(f"   {i}...")
             time.sleep(1)
         
-        # Record 3 seconds of audio
-        frames = []
+        # Record 3 seconds of audio straight into a preallocated buffer
         chunks_per_second = sample_rate // 4000
         total_chunks = chunks_per_second * 3
-        for _ in range(total_chunks):
-            data = stream.read(4000)
-            frames.append(data)
+        audio_data = np.empty(total_chunks * 4000, dtype=np.int16)
+        for i in range(total_chunks):
+            audio_data[i * 4000:(i + 1) * 4000] = np.frombuffer(stream.read(4000), dtype=np.int16)
         
         stream.stop_stream()
         stream.close()
         p.terminate()
         
-        # Convert to numpy array
-        audio_data = np.frombuffer(b''.join(frames), dtype=np.int16)
-        
-        # Analyze audio
-        max_amplitude = np.max(np.abs(audio_data))
-        mean_amplitude = np.mean(np.abs(audio_data))
+        # Analyze audio (one abs() pass shared by both reductions; int32
+        # so a clipped -32768 sample does not wrap back to itself)
+        abs_data = np.abs(audio_data, dtype=np.int32)
+        max_amplitude = abs_data.max()
+        mean_amplitude = abs_data.mean()
         
         print(f"\n📊 Results:")
         print(f"   Max amplitude: {max_amplitude:.2f}")